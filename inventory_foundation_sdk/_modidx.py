@@ -28,6 +28,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                      'inventory_foundation_sdk/custom_datasets.py')},
             'inventory_foundation_sdk.db_mgmt': { 'inventory_foundation_sdk.db_mgmt.SQLDatabase': ( 'db_mgmt.html#sqldatabase',
                                                                                                     'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt.SQLDatabase.__del__': ( 'db_mgmt.html#sqldatabase.__del__',
+                                                                                                            'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt.SQLDatabase.__enter__': ( 'db_mgmt.html#sqldatabase.__enter__',
+                                                                                                              'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt.SQLDatabase.__exit__': ( 'db_mgmt.html#sqldatabase.__exit__',
+                                                                                                             'inventory_foundation_sdk/db_mgmt.py'),
                                                   'inventory_foundation_sdk.db_mgmt.SQLDatabase.__init__': ( 'db_mgmt.html#sqldatabase.__init__',
                                                                                                              'inventory_foundation_sdk/db_mgmt.py'),
                                                   'inventory_foundation_sdk.db_mgmt.SQLDatabase.close': ( 'db_mgmt.html#sqldatabase.close',
@@ -38,12 +44,58 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                              'inventory_foundation_sdk/db_mgmt.py'),
                                                   'inventory_foundation_sdk.db_mgmt.SQLDatabase.execute_query': ( 'db_mgmt.html#sqldatabase.execute_query',
                                                                                                                   'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._InsertPlan': ( 'db_mgmt.html#_insertplan',
+                                                                                                    'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._build_insert_artifacts': ( 'db_mgmt.html#_build_insert_artifacts',
+                                                                                                                'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._cached_column_types': ( 'db_mgmt.html#_cached_column_types',
+                                                                                                             'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._cast_columns': ( 'db_mgmt.html#_cast_columns',
+                                                                                                      'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._check_unique_columns': ( 'db_mgmt.html#_check_unique_columns',
+                                                                                                              'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._column_types': ( 'db_mgmt.html#_column_types',
+                                                                                                      'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._column_types_query': ( 'db_mgmt.html#_column_types_query',
+                                                                                                            'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._copy_chunk': ( 'db_mgmt.html#_copy_chunk',
+                                                                                                    'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._copy_partition': ( 'db_mgmt.html#_copy_partition',
+                                                                                                        'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._get_connection_pool': ( 'db_mgmt.html#_get_connection_pool',
+                                                                                                             'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._ids_by_position': ( 'db_mgmt.html#_ids_by_position',
+                                                                                                         'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._insert_multi_rows_parallel': ( 'db_mgmt.html#_insert_multi_rows_parallel',
+                                                                                                                    'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._insert_page_returning_ids': ( 'db_mgmt.html#_insert_page_returning_ids',
+                                                                                                                   'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._intermediate_commit': ( 'db_mgmt.html#_intermediate_commit',
+                                                                                                             'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._is_pandas_dtype': ( 'db_mgmt.html#_is_pandas_dtype',
+                                                                                                         'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._return_connection': ( 'db_mgmt.html#_return_connection',
+                                                                                                           'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._staged_rows_queries': ( 'db_mgmt.html#_staged_rows_queries',
+                                                                                                             'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._staging_queries': ( 'db_mgmt.html#_staging_queries',
+                                                                                                         'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt._to_pgcopy_binary': ( 'db_mgmt.html#_to_pgcopy_binary',
+                                                                                                          'inventory_foundation_sdk/db_mgmt.py'),
                                                   'inventory_foundation_sdk.db_mgmt.check_in_scope_entries': ( 'db_mgmt.html#check_in_scope_entries',
                                                                                                                'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt.check_in_scope_entries_bulk': ( 'db_mgmt.html#check_in_scope_entries_bulk',
+                                                                                                                    'inventory_foundation_sdk/db_mgmt.py'),
                                                   'inventory_foundation_sdk.db_mgmt.get_db_credentials': ( 'db_mgmt.html#get_db_credentials',
                                                                                                            'inventory_foundation_sdk/db_mgmt.py'),
                                                   'inventory_foundation_sdk.db_mgmt.insert_multi_rows': ( 'db_mgmt.html#insert_multi_rows',
-                                                                                                          'inventory_foundation_sdk/db_mgmt.py')},
+                                                                                                          'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt.insert_multi_rows_arrow': ( 'db_mgmt.html#insert_multi_rows_arrow',
+                                                                                                                'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt.insert_multi_rows_async': ( 'db_mgmt.html#insert_multi_rows_async',
+                                                                                                                'inventory_foundation_sdk/db_mgmt.py'),
+                                                  'inventory_foundation_sdk.db_mgmt.insert_multi_rows_asyncpg': ( 'db_mgmt.html#insert_multi_rows_asyncpg',
+                                                                                                                  'inventory_foundation_sdk/db_mgmt.py')},
             'inventory_foundation_sdk.db_retrievers': { 'inventory_foundation_sdk.db_retrievers.get_company_id': ( 'db_retrievers.html#get_company_id',
                                                                                                                    'inventory_foundation_sdk/db_retrievers.py'),
                                                         'inventory_foundation_sdk.db_retrievers.get_date_id': ( 'db_retrievers.html#get_date_id',
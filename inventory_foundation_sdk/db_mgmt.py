@@ -3,25 +3,47 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/10_db_mgmt.ipynb.
 
 # %% auto 0
-__all__ = ['get_db_credentials', 'insert_multi_rows', 'check_in_scope_entries', 'SQLDatabase']
+__all__ = ['logger', 'get_db_credentials', 'check_in_scope_entries', 'check_in_scope_entries_bulk', 'insert_multi_rows',
+           'insert_multi_rows_async', 'insert_multi_rows_asyncpg', 'insert_multi_rows_arrow', 'SQLDatabase']
 
 # %% ../nbs/10_db_mgmt.ipynb 3
 from kedro.config import OmegaConfigLoader
 from kedro.framework.project import settings
 from pathlib import Path
+from functools import lru_cache
+import typing as t
+import io
+import json
+import os
+import asyncio
+import itertools
+import csv
+import struct
+import threading
+import uuid
+import concurrent.futures
 
 import pandas as pd
 import numpy as np
 from tqdm import tqdm
 
 import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+
+import logging
+
+logger = logging.getLogger(__name__)
 
 # %% ../nbs/10_db_mgmt.ipynb 4
+@lru_cache(maxsize=1)
 def get_db_credentials():
     """
     Fetch PostgreSQL database credentials from the configuration file of the kedro project.
 
     Uses `OmegaConfigLoader` to load credentials stored under `credentials.postgres`.
+    The configuration is only read once per process; call `get_db_credentials.cache_clear()` to reload it.
+    The returned dictionary is shared between callers and must not be modified.
 
     Returns:
         dict: A dictionary with the database connection details (e.g., host, port, user, password, dbname).
@@ -34,6 +56,601 @@ def get_db_credentials():
     return db_credentials
 
 # %% ../nbs/10_db_mgmt.ipynb 5
+def check_in_scope_entries(
+    target_table,
+    dataset_column,
+    id_column,
+    insert_arguments,
+    credentials,
+    dataset_id,
+    logger,
+    filter=None,
+    further_primary_keys=None,
+    further_primary_keys_values=None,
+):
+    """
+    Ensures all entries in the dataset scope have corresponding entries in the target table.
+    If an entry is missing, specified insert_arguments are set to zero.
+
+    Args:
+        target_table (str): The name of the target table to check and update.
+        dataset_column (str): The name of the column identifying the dataset (e.g., "datasetID").
+        id_column (str): The name of the column identifying the entries (e.g., "skuID").
+        insert_arguments (list): List of columns to be inserted with default zero values if missing.
+        further_primary_keys (list): Additional primary key columns in the target table.
+        further_primary_keys_values (list): Corresponding values for further_primary_keys.
+    """
+
+    check_in_scope_entries_bulk(
+        target_table,
+        dataset_column,
+        id_column,
+        insert_arguments,
+        credentials,
+        [dataset_id],
+        logger,
+        further_primary_keys=further_primary_keys,
+        further_primary_keys_values=further_primary_keys_values,
+    )
+
+
+def check_in_scope_entries_bulk(
+    target_table,
+    dataset_column,
+    id_column,
+    insert_arguments,
+    credentials,
+    dataset_ids: list,
+    logger,
+    further_primary_keys=None,
+    further_primary_keys_values=None,
+):
+    """
+    Same as `check_in_scope_entries`, but for several datasets and further primary key combinations at once:
+    the missing entries of all datasets in `dataset_ids`, for each combination of `further_primary_keys_values`,
+    are inserted with a single statement.
+
+    Args:
+        dataset_ids (list): The IDs of the datasets whose scope is checked.
+        further_primary_keys_values (list): Values for further_primary_keys, either one list of values or a list
+            of value lists (one per combination, e.g. `[[1, "a"], [2, "a"]]`).
+        For the other arguments, see `check_in_scope_entries`.
+    """
+
+    # Check if one is provided without the other
+    if (further_primary_keys is None) != (further_primary_keys_values is None):
+        raise ValueError(
+            "Both further_primary_keys and further_primary_keys_values must be provided together."
+        )
+
+    try:
+        with psycopg2.connect(credentials) as conn:
+            with conn.cursor() as cur:
+                # Build column list and select list, the missing entries are derived from the dataset scope
+                columns = [id_column, dataset_column] + insert_arguments
+                select_values = [f'dm."{id_column}"', f'dm."{dataset_column}"']
+                select_values += ["0"] * len(insert_arguments)
+                conflict_columns = [id_column, dataset_column]
+                fpk_join = ""
+                args = []
+
+                if further_primary_keys:
+                    # A single combination of values is treated as a list with one combination
+                    if not isinstance(further_primary_keys_values[0], (list, tuple)):
+                        further_primary_keys_values = [further_primary_keys_values]
+                    if any(
+                        len(values) != len(further_primary_keys)
+                        for values in further_primary_keys_values
+                    ):
+                        raise ValueError(
+                            "Each set of further_primary_keys_values must match further_primary_keys."
+                        )
+
+                    # The combinations are passed as JSON and read with the row type of the target table,
+                    # so every value gets the type of its target column
+                    fpk_list = ", ".join(f'"{col}"' for col in further_primary_keys)
+                    fpk_join = f"""
+                    CROSS JOIN (
+                        SELECT {fpk_list} FROM json_populate_recordset(NULL::{target_table}, %s)
+                    ) fpk"""
+                    columns += further_primary_keys
+                    select_values += [f'fpk."{col}"' for col in further_primary_keys]
+                    conflict_columns += further_primary_keys
+                    args.append(
+                        json.dumps(
+                            [
+                                dict(zip(further_primary_keys, values))
+                                for values in further_primary_keys_values
+                            ],
+                            default=str,
+                        )
+                    )
+
+                column_list = ", ".join(f'"{col}"' for col in columns)
+                select_list = ", ".join(select_values)
+                conflict_list = ", ".join(f'"{col}"' for col in conflict_columns)
+                # psycopg2 adapts the list to an array for `= ANY(%s)`
+                args.append(list(dataset_ids))
+
+                # Insert all `skuIDs` of the dataset scopes that are missing in the target table at once
+                cur.execute(
+                    f"""
+                    INSERT INTO {target_table} ({column_list})
+                    SELECT {select_list}
+                    FROM dataset_matching dm{fpk_join}
+                    WHERE dm."{dataset_column}" = ANY(%s)
+                    ON CONFLICT ({conflict_list})
+                    DO NOTHING;
+                """,
+                    args,
+                )
+                n_missing = cur.rowcount
+
+                if n_missing > 0:
+                    conn.commit()
+                    logger.info(f"Added {n_missing} missing IDs for {target_table}.")
+                else:
+                    logger.info("No missing IDs to handle.")
+
+    except Exception as e:
+        logger.error(f"Error checking in-scope entries for {target_table}: {e}")
+        raise e
+
+# %% ../nbs/10_db_mgmt.ipynb 6
+# numpy dtypes used to cast the columns for the given Python types, other types are passed to `astype` as is
+# if pandas understands them as dtype, and are applied value by value otherwise (e.g., `datetime.date`)
+_PYTHON_TYPES_TO_DTYPES = {int: np.int64, float: np.float64, str: str}
+
+# Passing `copy=False` avoids copying columns before pandas 3, which never copies them (Copy-on-Write) and deprecates it
+_NO_COPY = {"copy": False} if int(pd.__version__.split(".")[0]) < 3 else {}
+
+
+def _is_pandas_dtype(dtype) -> bool:
+    """
+    Returns whether `DataFrame.astype` understands `dtype`.
+    """
+    try:
+        pd.api.types.pandas_dtype(dtype)
+    except TypeError:
+        return False
+    return True
+
+
+def _cast_columns(data: pd.DataFrame, dtypes: tuple) -> pd.DataFrame:
+    """
+    Casts the columns of `data` to `dtypes`, one dtype per column (see `_PYTHON_TYPES_TO_DTYPES`).
+
+    `str` columns and types that are no pandas dtype are converted value by value with `Series.map`, as the
+    former per-cell casting did. Thereby missing values in `str` columns are written as 'nan' or 'None' like any
+    other value, whereas `astype(str)` keeps them as NaN since pandas 3.
+    """
+    mapped = [dtype is str or not _is_pandas_dtype(dtype) for dtype in dtypes]
+    typed_data = data.astype(
+        {
+            col: dtype
+            for col, dtype, is_mapped in zip(data.columns, dtypes, mapped)
+            if not is_mapped
+        },
+        **_NO_COPY,
+    )
+    for idx, (dtype, is_mapped) in enumerate(zip(dtypes, mapped)):
+        if is_mapped:
+            typed_data.isetitem(idx, data.iloc[:, idx].map(dtype))
+    return typed_data
+
+
+# Big-endian wire format and staging column type per Python type for the binary COPY format
+_PGCOPY_TYPES = {int: (">i8", "bigint"), float: (">f8", "double precision")}
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack(">h", -1)
+
+
+def _to_pgcopy_binary(data: pd.DataFrame, record_dtype: np.dtype) -> bytes:
+    """
+    Serializes a numeric DataFrame into the binary COPY format of PostgreSQL.
+
+    Each row is laid out as one record of a packed numpy structured array (field count, then length and
+    value per column), so the whole chunk is converted by numpy instead of packing row by row.
+    """
+    rows = np.empty(len(data), dtype=record_dtype)
+    rows["n_fields"] = len(data.columns)
+    for idx, col in enumerate(data.columns):
+        rows[f"length_{idx}"] = 8
+        rows[f"value_{idx}"] = data[col].to_numpy()
+
+    return _PGCOPY_HEADER + rows.tobytes() + _PGCOPY_TRAILER
+
+
+class _InsertPlan(t.NamedTuple):
+    """
+    Parts of an `insert_multi_rows` call that only depend on the table, columns and types.
+    """
+
+    dtypes: tuple  # dtype per column, passed to `_cast_columns`
+    insert_query: str  # INSERT ... RETURNING query (position and ID), or the query moving the staged rows into the target table
+    template: str = None  # row template for `execute_values` (return_with_ids only)
+    lookup_query: str = (
+        None  # looks up the IDs of rows the insert_query did not return one for (return_with_ids only)
+    )
+    staging_query: str = None  # creates the staging table (COPY only)
+    copy_query: str = None  # COPY into the staging table (COPY only)
+    pgcopy_dtype: np.dtype = None  # binary COPY record layout, None if CSV is used
+
+
+def _staging_queries(
+    staging_table: str,
+    table_name: str,
+    column_names: tuple,
+    types: tuple,
+    temporary: bool = True,
+) -> tuple[str, str]:
+    """
+    Returns the queries creating a staging table for `table_name` and copying into it. The staging table is
+    temporary and dropped on commit, or, if `temporary` is False, an unlogged table visible to other sessions.
+    """
+    column_names_str = ", ".join(f'"{col}"' for col in column_names)
+    create = "CREATE TEMP TABLE" if temporary else "CREATE UNLOGGED TABLE"
+    on_commit = " ON COMMIT DROP" if temporary else ""
+
+    if all(typ in _PGCOPY_TYPES for typ in types):
+        # The binary values are 8 bytes wide, the staging columns match them and are cast on the final insert
+        staging_columns = ", ".join(
+            f'"{col}" {_PGCOPY_TYPES[typ][1]}' for col, typ in zip(column_names, types)
+        )
+        staging_query = f"{create} {staging_table} ({staging_columns}){on_commit};"
+        copy_query = (
+            f"COPY {staging_table} ({column_names_str}) FROM STDIN WITH (FORMAT binary)"
+        )
+    else:
+        staging_query = f"""
+            {create} {staging_table}{on_commit} AS
+            SELECT {column_names_str} FROM {table_name} WITH NO DATA;
+        """
+        copy_query = (
+            f"COPY {staging_table} ({column_names_str}) FROM STDIN WITH (FORMAT csv)"
+        )
+    return staging_query, copy_query
+
+
+@lru_cache(maxsize=64)
+def _build_insert_artifacts(
+    table_name: str,
+    column_names: tuple,
+    types: tuple,
+    return_with_ids: bool,
+    unique_columns: tuple,
+    column_types: tuple = (),
+) -> _InsertPlan:
+    """
+    Builds the SQL statements and casting information of `insert_multi_rows`, cached per signature
+    since pipelines repeatedly insert into the same tables.
+    """
+    dtypes = tuple(_PYTHON_TYPES_TO_DTYPES.get(typ, typ) for typ in types)
+    column_names_str = ", ".join(f'"{col}"' for col in column_names)
+
+    if return_with_ids:
+        # Create SQL template and query; execute_values expands `VALUES %s` to one page of rows, each
+        # prefixed with its position and cast to the types of the target columns (`column_types`).
+        # Conflicting rows are skipped instead of updated (no new row versions) and get the ID of the
+        # existing row; the CTE's inserts are not visible to that lookup.
+        template = (
+            "(%s, " + ", ".join(f"%s::{col_type}" for col_type in column_types) + ")"
+        )
+        unique_columns_str = ", ".join(f'"{col}"' for col in unique_columns)
+        values_cte = f'WITH v ("_ord", {column_names_str}) AS (VALUES %s)'
+        insert_query = f"""
+            {values_cte},
+            ins AS (
+                INSERT INTO {table_name} ({column_names_str})
+                SELECT {column_names_str} FROM v ORDER BY "_ord"
+                ON CONFLICT ({unique_columns_str})
+                DO NOTHING
+                RETURNING {unique_columns_str}, "ID"
+            )
+            SELECT v."_ord", COALESCE(ins."ID", t."ID")
+            FROM v
+            LEFT JOIN ins USING ({unique_columns_str})
+            LEFT JOIN {table_name} t USING ({unique_columns_str});
+        """
+        lookup_query = f"""
+            {values_cte}
+            SELECT v."_ord", t."ID" FROM v JOIN {table_name} t USING ({unique_columns_str});
+        """
+        return _InsertPlan(
+            dtypes=dtypes,
+            insert_query=insert_query,
+            template=template,
+            lookup_query=lookup_query,
+        )
+
+    # Stage the rows in a temporary table so that COPY can be combined with ON CONFLICT DO NOTHING
+    # (temporary tables are not WAL-logged, so the staging copy adds no WAL traffic)
+    staging_table = f"_staging_{table_name.replace('.', '_')}"
+    staging_query, copy_query = _staging_queries(
+        staging_table, table_name, column_names, types
+    )
+    if all(typ in _PGCOPY_TYPES for typ in types):
+        fields = [("n_fields", ">i2")]
+        for idx, typ in enumerate(types):
+            fields += [
+                (f"length_{idx}", ">i4"),
+                (f"value_{idx}", _PGCOPY_TYPES[typ][0]),
+            ]
+        pgcopy_dtype = np.dtype(fields)
+    else:
+        pgcopy_dtype = None
+
+    flush_query = f"""
+        INSERT INTO {table_name} ({column_names_str})
+        SELECT {column_names_str} FROM {staging_table}
+        ON CONFLICT DO NOTHING;
+    """
+    return _InsertPlan(
+        dtypes=dtypes,
+        insert_query=flush_query,
+        staging_query=staging_query,
+        copy_query=copy_query,
+        pgcopy_dtype=pgcopy_dtype,
+    )
+
+
+_ASYNC_COMMIT_QUERY = "SET LOCAL synchronous_commit TO OFF;"
+
+
+def _intermediate_commit(cur, conn, synchronous_commit: bool) -> None:
+    """
+    Commits the current transaction of a load and, if requested, disables `synchronous_commit` for the next one.
+    """
+    conn.commit()
+    if not synchronous_commit:
+        cur.execute(_ASYNC_COMMIT_QUERY)
+
+
+# SQL types of the target columns per table name, looked up once per process (clear it after schema changes)
+_COLUMN_TYPES_CACHE = {}
+
+
+def _column_types_query(table_name: str) -> str:
+    """
+    Returns the query selecting the name and SQL type of every column in `table_name`.
+    """
+    # No trailing semicolon, ADBC wraps queries returning rows into a COPY
+    return f"""
+        SELECT a.attname, format_type(a.atttypid, a.atttypmod)
+        FROM pg_attribute a
+        WHERE a.attrelid = '{table_name.replace("'", "''")}'::regclass AND a.attnum > 0 AND NOT a.attisdropped
+    """
+
+
+def _cached_column_types(table_name: str, column_names: list) -> tuple:
+    """
+    Returns the SQL types of `column_names` from the types of `table_name` in `_COLUMN_TYPES_CACHE`.
+    """
+    types_by_name = _COLUMN_TYPES_CACHE[table_name]
+    missing = [col for col in column_names if col not in types_by_name]
+    if missing:
+        raise ValueError(f"Columns {missing} do not exist in {table_name}.")
+    return tuple(types_by_name[col] for col in column_names)
+
+
+def _column_types(cur, table_name: str, column_names: list) -> tuple:
+    """
+    Returns the SQL types of `column_names` in `table_name`, querying them with the DB-API cursor `cur`
+    (psycopg2 or ADBC) on first use.
+    """
+    if table_name not in _COLUMN_TYPES_CACHE:
+        cur.execute(_column_types_query(table_name))
+        _COLUMN_TYPES_CACHE[table_name] = dict(cur.fetchall())
+    return _cached_column_types(table_name, column_names)
+
+
+def _check_unique_columns(
+    typed_data: pd.DataFrame, column_names: list, unique_columns: list
+) -> None:
+    """
+    Raises if a unique column contains missing values, since such rows never conflict and cannot be matched to an ID.
+    """
+    null_columns = [
+        col
+        for col in unique_columns
+        if typed_data.iloc[:, column_names.index(col)].isna().any()
+    ]
+    if null_columns:
+        raise ValueError(
+            f"unique_columns {null_columns} must not contain NULL values when return_with_ids is True"
+        )
+
+
+def _insert_page_returning_ids(
+    cur, plan: _InsertPlan, page: list, ids: np.ndarray, page_size: int
+) -> None:
+    """
+    Inserts one page of `(position, *values)` rows and writes their IDs into `ids` at their positions.
+    """
+    first_position = page[0][0]
+    missing = []
+    for position, row_id in psycopg2.extras.execute_values(
+        cur,
+        plan.insert_query,
+        page,
+        template=plan.template,
+        page_size=page_size,
+        fetch=True,
+    ):
+        if row_id is None:
+            missing.append(page[position - first_position])
+        else:
+            ids[position] = row_id
+
+    if missing:
+        # Keys committed by another writer after the statement started are skipped by DO NOTHING, but are
+        # not visible to the statement itself; a new statement sees them
+        found = psycopg2.extras.execute_values(
+            cur,
+            plan.lookup_query,
+            missing,
+            template=plan.template,
+            page_size=page_size,
+            fetch=True,
+        )
+        for position, row_id in found:
+            ids[position] = row_id
+        if len(found) < len(missing):
+            raise ValueError(f"No ID found for {len(missing) - len(found)} rows.")
+
+
+def _ids_by_position(
+    positions: np.ndarray, row_ids: np.ndarray, n_rows: int
+) -> np.ndarray:
+    """
+    Orders the IDs returned as `(position, ID)` pairs by the position of their row, raising if a row has no ID.
+    """
+    ids = np.empty(n_rows, dtype=np.int64)
+    found = np.zeros(n_rows, dtype=bool)
+    ids[positions] = row_ids
+    found[positions] = True
+    if not found.all():
+        raise ValueError(f"No ID found for {(~found).sum()} rows.")
+    return ids
+
+
+def _copy_chunk(
+    cur, chunk: pd.DataFrame, copy_query: str, pgcopy_dtype: np.dtype
+) -> None:
+    """
+    Sends one chunk of typed rows to a staging table with `COPY`, in the binary format if `pgcopy_dtype` is given.
+    """
+    if pgcopy_dtype is not None:
+        buffer = io.BytesIO(_to_pgcopy_binary(chunk, pgcopy_dtype))
+    else:
+        buffer = io.StringIO()
+        # Strings are always quoted so that empty strings are not read as NULL,
+        # NaNs are written as 'NaN' so float columns keep receiving NaN rather than NULL
+        chunk.to_csv(
+            buffer,
+            header=False,
+            index=False,
+            na_rep="NaN",
+            quoting=csv.QUOTE_NONNUMERIC,
+        )
+        buffer.seek(0)
+    cur.copy_expert(copy_query, buffer)
+
+
+def _copy_partition(
+    data: pd.DataFrame,
+    staging_query: str,
+    copy_query: str,
+    pgcopy_dtype: np.dtype,
+    copy_chunk_size: int,
+    synchronous_commit: bool,
+    pbar: tqdm,
+) -> None:
+    """
+    Copies one partition of a parallel load into its own staging table, on a connection of the shared pool.
+    """
+    pool = _get_connection_pool()
+    try:
+        conn = pool.getconn()
+    except psycopg2.pool.PoolError as e:
+        # Other borrowers may hold connections of the shared pool, so fewer than n_workers can be available
+        raise psycopg2.pool.PoolError(
+            "No connection left in the shared pool for a parallel insert worker, "
+            "reduce n_workers or close unused SQLDatabase objects"
+        ) from e
+    try:
+        # Same as a fresh psycopg2 connection, regardless of how the connection was used before
+        conn.autocommit = False
+        with conn.cursor() as cur:
+            if not synchronous_commit:
+                cur.execute(_ASYNC_COMMIT_QUERY)
+            cur.execute(staging_query)
+            for start in range(0, len(data), copy_chunk_size):
+                chunk = data.iloc[start : start + copy_chunk_size]
+                _copy_chunk(cur, chunk, copy_query, pgcopy_dtype)
+                pbar.update(len(chunk))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _return_connection(pool, conn)
+
+
+def _insert_multi_rows_parallel(
+    typed_data: pd.DataFrame,
+    table_name: str,
+    column_names: tuple,
+    types: tuple,
+    pgcopy_dtype: np.dtype,
+    cur,
+    conn,
+    n_workers: int,
+    copy_chunk_size: int,
+    synchronous_commit: bool,
+) -> None:
+    """
+    COPY path of `insert_multi_rows` for `n_workers` > 1. The rows are split into `n_workers` row ranges, each
+    copied by its own pooled connection into an unlogged staging table (temporary tables are only visible to their
+    session). All staging tables are then merged into the target table in one transaction on `conn`.
+    """
+    prefix = f"_staging_{table_name.replace('.', '_')}_{uuid.uuid4().hex[:8]}"
+    staging_tables = [f"{prefix}_{idx}" for idx in range(n_workers)]
+    # Contiguous row ranges, sliced as views instead of copying the rows of each partition
+    bounds = [len(typed_data) * idx // n_workers for idx in range(n_workers + 1)]
+
+    column_names_str = ", ".join(f'"{col}"' for col in column_names)
+    staged_rows = " UNION ALL ".join(
+        f"SELECT {column_names_str} FROM {staging}" for staging in staging_tables
+    )
+    drop_query = f"DROP TABLE IF EXISTS {', '.join(staging_tables)};"
+
+    try:
+        with tqdm(total=len(typed_data), desc="Inserting rows") as pbar:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=n_workers
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _copy_partition,
+                        typed_data.iloc[start:stop],
+                        *_staging_queries(
+                            staging, table_name, column_names, types, temporary=False
+                        ),
+                        pgcopy_dtype,
+                        copy_chunk_size,
+                        synchronous_commit,
+                        pbar,
+                    )
+                    for staging, start, stop in zip(
+                        staging_tables, bounds[:-1], bounds[1:]
+                    )
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+
+        cur.execute(
+            f"""
+            INSERT INTO {table_name} ({column_names_str})
+            {staged_rows}
+            ON CONFLICT DO NOTHING;
+        """
+        )
+        cur.execute(drop_query)
+        conn.commit()
+    except Exception:
+        # Remove the staging tables the workers already committed, without hiding the original error
+        try:
+            conn.rollback()
+            cur.execute(drop_query)
+            conn.commit()
+        except Exception as cleanup_error:
+            logger.error(
+                f"Could not drop the staging tables {', '.join(staging_tables)}: {cleanup_error}"
+            )
+        raise
+
+
 def insert_multi_rows(
     data_to_insert: pd.DataFrame,
     table_name: str,
@@ -43,10 +660,18 @@ def insert_multi_rows(
     conn,
     return_with_ids: bool = False,
     unique_columns: list = None,  # mandatory if return_with_ids is True
+    batch_size_for_commit: int = None,  # only needed as a safety valve for very large loads
+    synchronous_commit: bool = True,
+    check_nans: bool = True,
+    n_workers: int = 1,
 ) -> pd.DataFrame | None:
     """
     Inserts data into the specified database table, with an optional return of database-assigned IDs.
 
+    Without `return_with_ids`, the rows are streamed with `COPY` into a temporary staging table and moved
+    into the target table with a single `INSERT ... SELECT ... ON CONFLICT DO NOTHING`. If all `types` are
+    int or float, the binary COPY format is used, otherwise CSV.
+
     Args:
         data_to_insert (pd.DataFrame): DataFrame containing the data to be inserted.
         table_name (str): Name of the target database table.
@@ -55,14 +680,28 @@ def insert_multi_rows(
         cur (psycopg2.cursor): Database cursor for executing SQL commands.
         conn (psycopg2.connection): Database connection for committing transactions.
         return_with_ids (bool): If True, returns the original DataFrame with an additional "ID" column.
+        unique_columns (list): Columns of the unique constraint used to resolve conflicts. Mandatory if `return_with_ids` is True.
+            They must not contain NULL values, otherwise a ValueError is raised before any row is inserted.
+        batch_size_for_commit (int, optional): If set, commits after roughly every `batch_size_for_commit` rows.
+            Defaults to None, i.e., all rows are inserted in a single transaction.
+        synchronous_commit (bool): If False, sets `synchronous_commit` to off for the load's transaction(s), so commits
+            do not wait for the WAL flush. Only use this for reloads that can be repeated from the source data.
+        check_nans (bool): If True, warns if the data contains NaNs. Set to False to skip the scan, NULLs in NOT NULL
+            columns are still rejected by the database.
+        n_workers (int): If larger than 1, the rows are copied in parallel by `n_workers` connections of the shared
+            `SQLDatabase` pool (which must point to the same database as `conn`) and merged in one transaction on
+            `conn`. At most `_CONNECTION_POOL_MAXCONN`, a PoolError is raised if the pool runs out of connections.
+            Not supported with `return_with_ids`, `batch_size_for_commit` is not applied.
 
     Returns:
         pd.DataFrame | None: Original DataFrame with an "ID" column if `return_with_ids` is True; otherwise, None.
+            The original DataFrame is not modified, and its columns are not copied.
     """
     # logger.info("-- in insert multi rows -- checking data")
 
     # Check for NaN values and log a warning if any are found
-    if data_to_insert.isnull().values.any():
+    # Checked column by column, stopping at the first column with a NaN
+    if check_nans and any(column.isna().any() for _, column in data_to_insert.items()):
         logger.warning("There are NaNs in the data")
 
     # Ensure the DataFrame has the correct number of columns
@@ -75,226 +714,382 @@ def insert_multi_rows(
             "Number of types does not match the number of columns in the DataFrame."
         )
 
-    # logger.info("-- in insert multi rows -- converting data to list of tuples")
-    # Convert to list of tuples and apply type casting
-
-    data_values = data_to_insert.values.tolist()
-    data_values = [
-        tuple(typ(val) for typ, val in zip(types, row)) for row in data_values
-    ]
+    if return_with_ids and not unique_columns:
+        raise ValueError("unique_columns must be provided when return_with_ids is True")
+    if return_with_ids and n_workers > 1:
+        raise ValueError("n_workers > 1 is not supported when return_with_ids is True")
+    if n_workers > _CONNECTION_POOL_MAXCONN:
+        raise ValueError(
+            f"n_workers must not exceed the {_CONNECTION_POOL_MAXCONN} connections of the pool"
+        )
 
     # logger.info("-- in insert multi rows -- preparing SQL")
-    # Create SQL placeholders and query
-    placeholders = ", ".join(["%s"] * len(column_names))
-    column_names_str = ", ".join(f'"{col}"' for col in column_names)
-
-    batch_size_for_commit = (
-        1_000_000  # Adjust this based on your dataset size and transaction tolerance
+    plan = _build_insert_artifacts(
+        table_name,
+        tuple(column_names),
+        tuple(types),
+        return_with_ids,
+        tuple(unique_columns or ()),
+        _column_types(cur, table_name, column_names) if return_with_ids else (),
     )
-    row_count = 0
 
+    # Apply the type casting column-wise instead of per cell
+    typed_data = _cast_columns(data_to_insert, plan.dtypes)
     if return_with_ids:
-        if not unique_columns:
-            raise ValueError(
-                "unique_columns must be provided when return_with_ids is True"
+        _check_unique_columns(typed_data, column_names, unique_columns)
+
+    copy_chunk_size = 100_000  # Number of rows sent per COPY call
+    page_size = 1_000  # Number of rows sent per INSERT ... RETURNING statement
+    rows_since_commit = 0
+
+    # Run the load as one explicit transaction, restoring the autocommit setting of the connection afterwards
+    autocommit = conn.autocommit
+    if autocommit:
+        conn.autocommit = False
+    try:
+        if not synchronous_commit:
+            cur.execute(_ASYNC_COMMIT_QUERY)
+
+        if return_with_ids:
+            # Rows are converted to tuples lazily, one page at a time, instead of materializing all of them.
+            # Each row carries its position, so the IDs are matched to the rows by the database.
+            data_values = (
+                (position, *row)
+                for position, row in enumerate(
+                    typed_data.itertuples(index=False, name=None)
+                )
+            )
+            ids = np.empty(len(typed_data), dtype=np.int64)
+
+            # Insert page by page and collect IDs
+            with tqdm(total=len(typed_data), desc="Inserting rows") as pbar:
+                while page := list(itertools.islice(data_values, page_size)):
+                    _insert_page_returning_ids(cur, plan, page, ids, page_size)
+                    rows_since_commit += len(page)
+                    pbar.update(len(page))
+
+                    # Optionally commit every batch_size_for_commit rows
+                    if (
+                        batch_size_for_commit
+                        and rows_since_commit >= batch_size_for_commit
+                    ):
+                        _intermediate_commit(cur, conn, synchronous_commit)
+                        rows_since_commit = 0
+            conn.commit()
+
+            # Free the typed copy of the data before allocating the result
+            del data_values, typed_data
+
+            # Add IDs back to the original DataFrame without copying its columns
+            data_with_ids = pd.concat(
+                [data_to_insert, pd.DataFrame({"ID": ids}, index=data_to_insert.index)],
+                axis=1,
+                **_NO_COPY,
+            )
+            return data_with_ids
+
+        elif n_workers > 1:
+            _insert_multi_rows_parallel(
+                typed_data,
+                table_name,
+                tuple(column_names),
+                tuple(types),
+                plan.pgcopy_dtype,
+                cur,
+                conn,
+                n_workers,
+                copy_chunk_size,
+                synchronous_commit,
             )
 
-        unique_columns_str = ", ".join(f'"{col}"' for col in unique_columns)
-        insert_query = f"""
-            INSERT INTO {table_name} ({column_names_str})
-            VALUES ({placeholders})
-            ON CONFLICT ({unique_columns_str})
-            DO UPDATE SET "{unique_columns[0]}" = EXCLUDED."{unique_columns[0]}"
-            RETURNING "ID";
-        """
-        ids = []
-
-        # Insert row by row and collect IDs
-        with tqdm(total=len(data_values), desc="Inserting rows") as pbar:
-            for row in data_values:
-                cur.execute(insert_query, row)
-                row_id = cur.fetchone()
-                if row_id:
-                    ids.append(row_id[0])
-                row_count += 1
-                pbar.update(1)  # Update progress bar for each row
-
-                # Commit every batch_size_for_commit rows
-                if row_count % batch_size_for_commit == 0:
-                    conn.commit()  # Commit the transaction
-        conn.commit()
+        else:
+            cur.execute(plan.staging_query)
+
+            # Stream the data chunk-wise into the staging table
+            with tqdm(total=len(typed_data), desc="Inserting rows") as pbar:
+                for start in range(0, len(typed_data), copy_chunk_size):
+                    chunk = typed_data.iloc[start : start + copy_chunk_size]
+                    _copy_chunk(cur, chunk, plan.copy_query, plan.pgcopy_dtype)
+                    rows_since_commit += len(chunk)
+                    pbar.update(len(chunk))
+
+                    # Optionally move the staged rows and commit every batch_size_for_commit rows
+                    if (
+                        batch_size_for_commit
+                        and rows_since_commit >= batch_size_for_commit
+                    ):
+                        cur.execute(plan.insert_query)
+                        _intermediate_commit(cur, conn, synchronous_commit)
+                        cur.execute(
+                            plan.staging_query
+                        )  # The commit dropped the staging table
+                        rows_since_commit = 0
+
+            cur.execute(plan.insert_query)
+            conn.commit()  # Commit all changes after processing (also drops the staging table)
+
+    finally:
+        if autocommit:
+            conn.rollback()  # No-op after the final commit, discards a failed load
+            conn.autocommit = True
 
-        # Add IDs back to the original DataFrame
-        data_with_ids = data_to_insert.copy()
-        data_with_ids["ID"] = ids
-        return data_with_ids
+    return None
 
-    else:
-        insert_query = f"""
-            INSERT INTO {table_name} ({column_names_str})
-            VALUES ({placeholders})
-            ON CONFLICT DO NOTHING;
-        """
+# %% ../nbs/10_db_mgmt.ipynb 7
+def _staged_rows_queries(
+    table_name: str,
+    staging_table: str,
+    column_names: list,
+    column_types: tuple,
+    unique_columns: list = None,
+) -> tuple[str, str]:
+    """
+    Returns the query moving the rows of `staging_table` into `table_name`, casting them to the SQL `column_types` of
+    the target columns, and the query selecting the `(position, ID)` of the staged rows via the `unique_columns`
+    (None without `unique_columns`).
+    """
+    # No trailing semicolons, ADBC wraps queries returning rows into a COPY
+    column_names_str = ", ".join(f'"{col}"' for col in column_names)
+    cast_columns = ", ".join(
+        f's."{col}"::{col_type}' for col, col_type in zip(column_names, column_types)
+    )
+    insert_query = f"""
+        INSERT INTO {table_name} ({column_names_str})
+        SELECT {cast_columns} FROM {staging_table} s
+        ON CONFLICT DO NOTHING
+    """
 
-        # Insert row by row without returning IDs
-        with tqdm(total=len(data_values), desc="Inserting rows") as pbar:
-            for row in data_values:
-                cur.execute(insert_query, row)
-                row_count += 1
-                pbar.update(1)  # Update progress bar for each row
-                if row_count % batch_size_for_commit == 0:
-                    conn.commit()  # Commit the transaction
+    if not unique_columns:
+        return insert_query, None
 
-        conn.commit()  # Commit all changes after processing
+    types_by_name = dict(zip(column_names, column_types))
+    join_condition = " AND ".join(
+        f't."{col}" = s."{col}"::{types_by_name[col]}' for col in unique_columns
+    )
+    ids_query = f"""
+        SELECT s."_ord", t."ID"
+        FROM {staging_table} s
+        JOIN {table_name} t ON {join_condition}
+    """
+    return insert_query, ids_query
 
-    return None
 
-# %% ../nbs/10_db_mgmt.ipynb 6
-def check_in_scope_entries(
-    target_table,
-    dataset_column,
-    id_column,
-    insert_arguments,
-    credentials,
-    dataset_id,
-    logger,
-    filter=None,
-    further_primary_keys=None,
-    further_primary_keys_values=None,
-):
+async def insert_multi_rows_async(
+    data_to_insert: pd.DataFrame,
+    table_name: str,
+    column_names: list,
+    types: list,
+    conn,
+    return_with_ids: bool = False,
+    unique_columns: list = None,  # mandatory if return_with_ids is True
+) -> pd.DataFrame | None:
     """
-    Ensures all entries in the dataset scope have corresponding entries in the target table.
-    If an entry is missing, specified insert_arguments are set to zero.
+    Asynchronous variant of `insert_multi_rows` for an `asyncpg` connection.
+
+    The rows are sent with `copy_records_to_table` (asyncpg's binary COPY) into a temporary staging table and moved
+    into the target table with `INSERT ... SELECT ... ON CONFLICT DO NOTHING`, all within one transaction.
+    Several inserts can thereby run concurrently on different connections. `str` columns are staged as text and
+    cast to the type of their target column (e.g., date) on the final insert, the other values have to match the
+    type of their target column.
 
     Args:
-        target_table (str): The name of the target table to check and update.
-        dataset_column (str): The name of the column identifying the dataset (e.g., "datasetID").
-        id_column (str): The name of the column identifying the entries (e.g., "skuID").
-        insert_arguments (list): List of columns to be inserted with default zero values if missing.
-        further_primary_keys (list): Additional primary key columns in the target table.
-        further_primary_keys_values (list): Corresponding values for further_primary_keys.
+        data_to_insert (pd.DataFrame): DataFrame containing the data to be inserted.
+        table_name (str): Name of the target database table.
+        column_names (list): List of column names for the target table.
+        types (list): List of Python types (e.g., [int, float]) for data conversion.
+        conn (asyncpg.Connection): Database connection.
+        return_with_ids (bool): If True, returns the original DataFrame with an additional "ID" column.
+        unique_columns (list): Columns of the unique constraint used to match the IDs. Mandatory if `return_with_ids` is True.
+
+    Returns:
+        pd.DataFrame | None: Original DataFrame with an "ID" column if `return_with_ids` is True; otherwise, None.
     """
 
-    # Check if one is provided without the other
-    if (further_primary_keys is None) != (further_primary_keys_values is None):
+    # Ensure the DataFrame has the correct number of columns
+    if len(column_names) != data_to_insert.shape[1]:
         raise ValueError(
-            "Both further_primary_keys and further_primary_keys_values must be provided together."
+            "Number of column names does not match the number of columns in the DataFrame."
+        )
+    if len(types) != data_to_insert.shape[1]:
+        raise ValueError(
+            "Number of types does not match the number of columns in the DataFrame."
         )
+    if return_with_ids and not unique_columns:
+        raise ValueError("unique_columns must be provided when return_with_ids is True")
 
-    try:
-        with psycopg2.connect(credentials) as conn:
-            with conn.cursor() as cur:
-                # Step 1: Get all `skuIDs` in the dataset scope
-                cur.execute(
-                    f"""
-                    SELECT "{id_column}"
-                    FROM dataset_matching
-                    WHERE "{dataset_column}" = %s;
-                """,
-                    (dataset_id,),
-                )
-                all_sku_ids = {row[0] for row in cur.fetchall()}
+    typed_data = _cast_columns(
+        data_to_insert, tuple(_PYTHON_TYPES_TO_DTYPES.get(typ, typ) for typ in types)
+    )
+    if return_with_ids:
+        _check_unique_columns(typed_data, column_names, unique_columns)
 
-                # Step 2: Build query for `skuIDs` in the target table
-                where_clause = f'"{dataset_column}" = %s'
-                query_params = [dataset_id]
+    if table_name not in _COLUMN_TYPES_CACHE:
+        _COLUMN_TYPES_CACHE[table_name] = dict(
+            tuple(row) for row in await conn.fetch(_column_types_query(table_name))
+        )
+    column_types = _cached_column_types(table_name, column_names)
 
-                if further_primary_keys:
-                    additional_conditions = " AND ".join(
-                        f'"{key}" = %s' for key in further_primary_keys
-                    )
-                    where_clause += f" AND {additional_conditions}"
-                    query_params.extend(further_primary_keys_values)
+    # asyncpg encodes the values by the type of the staging columns, hence str values are staged as text
+    staging_columns = ", ".join(
+        f'"{col}"::text AS "{col}"' if typ is str else f'"{col}"'
+        for col, typ in zip(column_names, types)
+    )
+    # asyncpg quotes the table name of the COPY, hence the staging table name is kept lowercase
+    staging_table = f"_staging_{table_name.replace('.', '_')}".lower()
+    insert_query, ids_query = _staged_rows_queries(
+        table_name, staging_table, column_names, column_types, unique_columns
+    )
 
-                cur.execute(
-                    f"""
-                    SELECT DISTINCT "{id_column}"
-                    FROM {target_table}
-                    WHERE {where_clause};
-                """,
-                    query_params,
+    async with conn.transaction():
+        await conn.execute(
+            f"""
+            CREATE TEMP TABLE {staging_table} ON COMMIT DROP AS
+            SELECT 0::bigint AS "_ord", {staging_columns} FROM {table_name} WITH NO DATA;
+        """
+        )
+        # Each row carries its position, so the IDs can be matched to the rows by the database
+        await conn.copy_records_to_table(
+            staging_table,
+            records=(
+                (position, *row)
+                for position, row in enumerate(
+                    typed_data.itertuples(index=False, name=None)
                 )
-                existing_sku_ids = {row[0] for row in cur.fetchall()}
+            ),
+            columns=["_ord", *column_names],
+        )
+        await conn.execute(insert_query)
 
-                # Step 3: Identify missing `skuIDs`
-                missing_sku_ids = all_sku_ids - existing_sku_ids
+        if not return_with_ids:
+            return None
 
-                if missing_sku_ids:
-                    logger.info(
-                        f"Adding missing IDs for {target_table}: {missing_sku_ids}"
-                    )
+        # Fetch the IDs of all staged rows, whether they were inserted now or existed before
+        # (a new statement also sees the rows other writers committed in the meantime)
+        returned_rows = await conn.fetch(ids_query)
 
-                    # Build column list and placeholders
-                    columns = [id_column, dataset_column] + insert_arguments
-                    value_placeholders = ["%s", "%s"] + ["0"] * len(insert_arguments)
+    returned_rows = np.array(
+        [tuple(row) for row in returned_rows], dtype=np.int64
+    ).reshape(-1, 2)
+    ids = _ids_by_position(
+        returned_rows[:, 0], returned_rows[:, 1], len(data_to_insert)
+    )
 
-                    if further_primary_keys:
-                        columns += further_primary_keys
-                        value_placeholders += ["%s"] * len(further_primary_keys)
+    data_with_ids = pd.concat(
+        [data_to_insert, pd.DataFrame({"ID": ids}, index=data_to_insert.index)],
+        axis=1,
+        **_NO_COPY,
+    )
+    return data_with_ids
 
-                    column_list = ", ".join(f'"{col}"' for col in columns)
-                    placeholder_list = ", ".join(value_placeholders)
 
-                    for sku_id in missing_sku_ids:
-                        # Build arguments dynamically
-                        args = [sku_id, dataset_id]
-                        if further_primary_keys_values:
-                            args += further_primary_keys_values
+def insert_multi_rows_asyncpg(
+    data_to_insert: pd.DataFrame,
+    table_name: str,
+    column_names: list,
+    types: list,
+    credentials: str,
+    return_with_ids: bool = False,
+    unique_columns: list = None,  # mandatory if return_with_ids is True
+) -> pd.DataFrame | None:
+    """
+    Synchronous wrapper around `insert_multi_rows_async` for kedro nodes, opening its own `asyncpg` connection.
 
-                        query = f"""
-                            INSERT INTO {target_table} ({column_list})
-                            VALUES ({placeholder_list})
-                            ON CONFLICT ({", ".join(f'"{col}"' for col in [id_column, dataset_column] + (further_primary_keys or []))})
-                            DO NOTHING;
-                        """
+    Requires the optional dependency `asyncpg` and must not be called from within a running event loop.
 
-                        # Debugging information
-                        # print(f"Executing query: {query}")
-                        # print(f"With arguments: {args}")
+    Args:
+        credentials (str): The credentials connection string (e.g., `get_db_credentials()["con"]`).
+        For the other arguments, see `insert_multi_rows_async`.
 
-                        # Execute the query
-                        cur.execute(query, args)
+    Returns:
+        pd.DataFrame | None: Original DataFrame with an "ID" column if `return_with_ids` is True; otherwise, None.
+    """
 
-                    conn.commit()
-                    logger.info(f"Missing IDs handled successfully for {target_table}.")
-                else:
-                    logger.info("No missing IDs to handle.")
+    try:
+        import asyncpg
+    except ImportError as e:
+        raise ImportError(
+            "insert_multi_rows_asyncpg requires asyncpg, install it with `pip install asyncpg`"
+        ) from e
+
+    async def _insert():
+        conn = await asyncpg.connect(credentials)
+        try:
+            return await insert_multi_rows_async(
+                data_to_insert,
+                table_name,
+                column_names,
+                types,
+                conn,
+                return_with_ids=return_with_ids,
+                unique_columns=unique_columns,
+            )
+        finally:
+            await conn.close()
 
-    except Exception as e:
-        logger.error(f"Error checking in-scope entries for {target_table}: {e}")
-        raise e
+    return asyncio.run(_insert())
 
-# %% ../nbs/10_db_mgmt.ipynb 7
-def insert_multi_rows(
+# %% ../nbs/10_db_mgmt.ipynb 8
+def insert_multi_rows_arrow(
     data_to_insert: pd.DataFrame,
     table_name: str,
     column_names: list,
     types: list,
-    cur,
-    conn,
+    credentials: str,
     return_with_ids: bool = False,
     unique_columns: list = None,  # mandatory if return_with_ids is True
+    use_adbc: bool = True,
 ) -> pd.DataFrame | None:
     """
-    Inserts data into the specified database table, with an optional return of database-assigned IDs.
+    Variant of `insert_multi_rows` that passes the DataFrame as an Arrow table to the ADBC PostgreSQL driver,
+    so the columns are streamed to the database without converting the rows to Python tuples.
+
+    The Arrow table is ingested into a temporary staging table and moved into the target table with
+    `INSERT ... SELECT ... ON CONFLICT DO NOTHING`. The staging columns get the Arrow types (e.g., bigint,
+    double precision, text) and are cast to the types of their target columns (e.g., date) on the final insert.
+
+    Requires the optional dependencies `pyarrow` and `adbc-driver-postgresql`. If they are not installed,
+    or if `use_adbc` is False, the data is inserted with `insert_multi_rows` instead.
 
     Args:
         data_to_insert (pd.DataFrame): DataFrame containing the data to be inserted.
         table_name (str): Name of the target database table.
         column_names (list): List of column names for the target table.
         types (list): List of Python types (e.g., [int, float]) for data conversion.
-        cur (psycopg2.cursor): Database cursor for executing SQL commands.
-        conn (psycopg2.connection): Database connection for committing transactions.
+        credentials (str): The credentials connection string (e.g., `get_db_credentials()["con"]`).
         return_with_ids (bool): If True, returns the original DataFrame with an additional "ID" column.
+        unique_columns (list): Columns of the unique constraint used to match the IDs. Mandatory if `return_with_ids` is True.
+        use_adbc (bool): If False, uses the psycopg2 based `insert_multi_rows`.
 
     Returns:
         pd.DataFrame | None: Original DataFrame with an "ID" column if `return_with_ids` is True; otherwise, None.
     """
-    # logger.info("-- in insert multi rows -- checking data")
 
-    # Check for NaN values and log a warning if any are found
-    if data_to_insert.isnull().values.any():
-        logger.warning("There are NaNs in the data")
+    if use_adbc:
+        try:
+            import pyarrow as pa
+            import adbc_driver_postgresql.dbapi
+        except ImportError:
+            logger.warning(
+                "pyarrow or adbc-driver-postgresql is not installed, falling back to psycopg2"
+            )
+            use_adbc = False
+
+    if not use_adbc:
+        conn = psycopg2.connect(credentials)
+        try:
+            with conn, conn.cursor() as cur:
+                return insert_multi_rows(
+                    data_to_insert,
+                    table_name,
+                    column_names,
+                    types,
+                    cur,
+                    conn,
+                    return_with_ids=return_with_ids,
+                    unique_columns=unique_columns,
+                )
+        finally:
+            conn.close()  # Leaving the `with` block only ends the transaction
 
     # Ensure the DataFrame has the correct number of columns
     if len(column_names) != data_to_insert.shape[1]:
@@ -305,130 +1100,175 @@ def insert_multi_rows(
         raise ValueError(
             "Number of types does not match the number of columns in the DataFrame."
         )
+    if return_with_ids and not unique_columns:
+        raise ValueError("unique_columns must be provided when return_with_ids is True")
 
-    # logger.info("-- in insert multi rows -- converting data to list of tuples")
-    # Convert to list of tuples and apply type casting
+    typed_data = _cast_columns(
+        data_to_insert, tuple(_PYTHON_TYPES_TO_DTYPES.get(typ, typ) for typ in types)
+    )
+    if return_with_ids:
+        _check_unique_columns(typed_data, column_names, unique_columns)
+    arrow_table = pa.Table.from_pandas(typed_data, preserve_index=False).rename_columns(
+        list(column_names)
+    )
+    if return_with_ids:
+        # Each row carries its position, so the IDs can be matched to the rows by the database
+        arrow_table = arrow_table.append_column(
+            "_ord", pa.array(np.arange(len(typed_data), dtype=np.int64))
+        )
 
-    data_values = data_to_insert.values.tolist()
-    data_values = [
-        tuple(typ(val) for typ, val in zip(types, row)) for row in data_values
-    ]
+    staging_table = f"_staging_{table_name.replace('.', '_')}".lower()
 
-    # logger.info("-- in insert multi rows -- preparing SQL")
-    # Create SQL placeholders and query
-    placeholders = ", ".join(["%s"] * len(column_names))
-    column_names_str = ", ".join(f'"{col}"' for col in column_names)
+    with adbc_driver_postgresql.dbapi.connect(credentials) as conn:
+        with conn.cursor() as cur:
+            column_types = _column_types(cur, table_name, column_names)
+            insert_query, ids_query = _staged_rows_queries(
+                table_name, staging_table, column_names, column_types, unique_columns
+            )
 
-    batch_size_for_commit = (
-        1_000_000  # Adjust this based on your dataset size and transaction tolerance
-    )
-    row_count = 0
+            cur.adbc_ingest(staging_table, arrow_table, mode="create", temporary=True)
+            cur.execute(insert_query)
 
-    if return_with_ids:
-        if not unique_columns:
-            raise ValueError(
-                "unique_columns must be provided when return_with_ids is True"
-            )
+            if return_with_ids:
+                # Fetch the IDs of all staged rows, whether they were inserted now or existed before
+                # (a new statement also sees the rows other writers committed in the meantime)
+                cur.execute(ids_query)
+                returned_rows = cur.fetch_arrow_table()
 
-        unique_columns_str = ", ".join(f'"{col}"' for col in unique_columns)
-        insert_query = f"""
-            INSERT INTO {table_name} ({column_names_str})
-            VALUES ({placeholders})
-            ON CONFLICT ({unique_columns_str})
-            DO UPDATE SET "{unique_columns[0]}" = EXCLUDED."{unique_columns[0]}"
-            RETURNING "ID";
-        """
-        ids = []
-
-        # Insert row by row and collect IDs
-        with tqdm(total=len(data_values), desc="Inserting rows") as pbar:
-            for row in data_values:
-                cur.execute(insert_query, row)
-                row_id = cur.fetchone()
-                if row_id:
-                    ids.append(row_id[0])
-                row_count += 1
-                pbar.update(1)  # Update progress bar for each row
-
-                # Commit every batch_size_for_commit rows
-                if row_count % batch_size_for_commit == 0:
-                    conn.commit()  # Commit the transaction
+            cur.execute(f"DROP TABLE {staging_table}")
         conn.commit()
 
-        # Add IDs back to the original DataFrame
-        data_with_ids = data_to_insert.copy()
-        data_with_ids["ID"] = ids
-        return data_with_ids
+    if not return_with_ids:
+        return None
 
-    else:
-        insert_query = f"""
-            INSERT INTO {table_name} ({column_names_str})
-            VALUES ({placeholders})
-            ON CONFLICT DO NOTHING;
-        """
+    ids = _ids_by_position(
+        returned_rows.column("_ord").to_numpy(),
+        returned_rows.column("ID").to_numpy(),
+        len(data_to_insert),
+    )
 
-        # Insert row by row without returning IDs
-        with tqdm(total=len(data_values), desc="Inserting rows") as pbar:
-            for row in data_values:
-                cur.execute(insert_query, row)
-                row_count += 1
-                pbar.update(1)  # Update progress bar for each row
-                if row_count % batch_size_for_commit == 0:
-                    conn.commit()  # Commit the transaction
+    data_with_ids = pd.concat(
+        [data_to_insert, pd.DataFrame({"ID": ids}, index=data_to_insert.index)],
+        axis=1,
+        **_NO_COPY,
+    )
+    return data_with_ids
 
-        conn.commit()  # Commit all changes after processing
+# %% ../nbs/10_db_mgmt.ipynb 9
+_CONNECTION_POOL = None
+_CONNECTION_POOL_PID = None
+_CONNECTION_POOL_LOCK = threading.Lock()
+# Maximum number of connections that can be borrowed at the same time
+_CONNECTION_POOL_MAXCONN = 20
+
+
+def _get_connection_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """
+    Returns the connection pool of the process, creating it from the kedro credentials on first use.
+    A forked process (e.g., by kedro's ParallelRunner) gets its own pool instead of sharing the parent's sockets.
+    """
+    global _CONNECTION_POOL, _CONNECTION_POOL_PID
+    with _CONNECTION_POOL_LOCK:
+        # The parent's pool is dropped without closing it, which would terminate the parent's sessions
+        if (
+            _CONNECTION_POOL is None
+            or _CONNECTION_POOL.closed
+            or _CONNECTION_POOL_PID != os.getpid()
+        ):
+            _CONNECTION_POOL = psycopg2.pool.ThreadedConnectionPool(
+                minconn=1,
+                maxconn=_CONNECTION_POOL_MAXCONN,
+                dsn=get_db_credentials()["con"],
+            )
+            _CONNECTION_POOL_PID = os.getpid()
+    return _CONNECTION_POOL
+
+
+def _return_connection(pool: psycopg2.pool.ThreadedConnectionPool, conn) -> None:
+    """
+    Returns a borrowed connection to the pool. Uncommitted changes are rolled back and the session state
+    (settings, temporary tables, prepared statements) is reset, so it does not carry over to the next borrower.
+    """
+    try:
+        conn.rollback()
+        conn.autocommit = True  # DISCARD ALL cannot run inside a transaction block
+        with conn.cursor() as cur:
+            cur.execute("DISCARD ALL;")
+    except psycopg2.Error:
+        # A broken connection is closed and replaced by the pool
+        pool.putconn(conn, close=True)
+    else:
+        pool.putconn(conn)
 
-    return None
 
-# %% ../nbs/10_db_mgmt.ipynb 8
 class SQLDatabase:
     """
     A class to represent a SQL database.
 
+    The connection is borrowed from a pool of at most `_CONNECTION_POOL_MAXCONN` connections shared by all
+    SQLDatabase objects, so it has to be returned with `close()` (or by using the object as a context manager,
+    `with SQLDatabase() as db: ...`) once it is no longer needed. Objects that are garbage-collected return it as well.
+
     Attributes:
     ----------
-    credentials : dict
-        A dictionary containing the database connection credentials.
     connection : psycopg2.connection
-        The database connection object.
+        The database connection object, borrowed from a connection pool shared by all SQLDatabase objects.
 
     Methods:
     -------
     connect():
-        Connects to the database using the provided credentials.
+        Borrows a database connection from the pool.
 
     close():
-        Closes the database connection.
+        Returns the database connection to the pool.
 
     execute_query(query: str):
         Executes the given SQL query.
 
-    execute_multiple_queries(queries: list, params: list = None, fetchrows: bool = False):
+    execute_multiple_queries(queries: list, params: list = None, fetchrows: bool = False, page_size: int = 500):
         Executes a list or iterable of SQL queries.
         If fetchrows is True, iterates over queries and fetches rows.
-        If fetchrows is False, uses executemany for batch execution.
+        If fetchrows is False, uses psycopg2.extras.execute_batch for batch execution.
     """
 
     def __init__(self):
         """
-        Initializes the SQLDatabase object with the provided database connection credentials.
+        Initializes the SQLDatabase object with the connection pool for the kedro database credentials.
         """
-        self._credentials = get_db_credentials()["con"]
+        self._pool = _get_connection_pool()
         self.connection = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass  # The pool may already be gone at interpreter shutdown
+
     def connect(self):
         """
-        Connects to the database using the provided credentials.
+        Borrows a connection from the pool, which avoids a new connection handshake per SQLDatabase object.
         """
         if not self.connection:
-            self.connection = psycopg2.connect(self._credentials)
+            self._pool = _get_connection_pool()
+            self._pid = os.getpid()
+            self.connection = self._pool.getconn()
+            # Same as a fresh psycopg2 connection, regardless of how the connection was used before
+            self.connection.autocommit = False
 
     def close(self):
         """
-        Closes the database connection.
+        Returns the connection to the pool. Uncommitted changes are rolled back and the session state is reset.
         """
         if self.connection:
-            self.connection.close()
+            # A connection inherited from the parent process belongs to the parent's pool and is left alone
+            if self._pid == os.getpid():
+                _return_connection(self._pool, self.connection)
             self.connection = None
 
     def execute_query(
@@ -477,12 +1317,16 @@ class SQLDatabase:
         return result
 
     def execute_multiple_queries(
-        self, queries: list | str, params: list = None, fetchrows: bool = False
+        self,
+        queries: list | str,
+        params: list = None,
+        fetchrows: bool = False,
+        page_size: int = 500,
     ):
         """
         Executes a list or iterable of SQL queries.
         If fetchrows is True, iterates over queries and fetches rows.
-        If fetchrows is False, tries to use executemany for batch execution.
+        If fetchrows is False, uses psycopg2.extras.execute_batch for batch execution.
 
         Parameters:
         -----------
@@ -493,12 +1337,15 @@ class SQLDatabase:
             A list of tuples containing parameters for each query. Defaults to None.
 
         fetchrows : bool, optional
-            Whether to fetch rows from the queries. Defaults to False (use executemany).
+            Whether to fetch rows from the queries. Defaults to False (use execute_batch).
+
+        page_size : int, optional
+            Number of parameter sets sent to the server per round-trip when using execute_batch. Defaults to 500.
 
         Returns:
         --------
         results : list
-            A list of results for each executed query, or None if using executemany.
+            A list of results for each executed query, or None if using execute_batch.
         """
         if not self.connection:
             self.connect()
@@ -523,10 +1370,11 @@ class SQLDatabase:
                 if not isinstance(queries, str):
                     # In this case only one query with multiple params can be executed (raise error)
                     raise ValueError(
-                        "Multiple queries with multiple params are not supported when using executemany. Set fetchrows=True"
+                        "Multiple queries with multiple params are not supported when using execute_batch. Set fetchrows=True"
                     )
 
-                cur.executemany(queries, params)
+                # Send the statements in pages instead of one round-trip per parameter set
+                psycopg2.extras.execute_batch(cur, queries, params, page_size=page_size)
 
         self.connection.commit()
 
@@ -903,13 +903,14 @@ def get_sku_ids(
     )
 
     # Insert data into the temporary table
-    psycopg2.extras.execute_batch(
+    psycopg2.extras.execute_values(
         cur,
         f"""
         INSERT INTO {temp_table_name} (storeID, productID)
-        VALUES (%s, %s);
+        VALUES %s;
         """,
         temp_data.values.tolist(),
+        page_size=1000,
     )
 
     # Query sku_table using a JOIN
@@ -975,6 +976,7 @@ def get_datapoint_ids(cur, datapoint_combinations: pd.DataFrame) -> pd.DataFrame
             VALUES %s;
             """,
             combinations_list,
+            page_size=1000,
         )
 
         # Query for datapointIDs